@@ -1,12 +1,217 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+
 import yfinance as yf
+import numba
+import numpy as np
 import pandas as pd
-from sklearn.preprocessing import MinMaxScaler
-import matplotlib.pyplot as plt
-import seaborn as sns
+import matplotlib
 import matplotlib.pyplot as plt
-from statsmodels.tsa.seasonal import seasonal_decompose
 
 
+@numba.njit(nogil=True)
+def _rolling_mean_std(x, window):
+    """
+    Rolling mean and sample standard deviation in a single pass.
+
+    Keeps a running sum and sum of squares over the window; a window holding
+    any NaN yields NaN, matching pandas' rolling(window).mean()/.std().
+    Accumulates in float64 but returns arrays of the input's dtype.
+    """
+    n = x.shape[0]
+    mean = np.full(n, np.nan, dtype=x.dtype)
+    std = np.full(n, np.nan, dtype=x.dtype)
+    s = 0.0
+    s2 = 0.0
+    nans = 0
+    for i in range(n):
+        # Widen before squaring so float32 input doesn't lose the sum of squares
+        v = np.float64(x[i])
+        if np.isnan(v):
+            nans += 1
+        else:
+            s += v
+            s2 += v * v
+        if i >= window:
+            old = np.float64(x[i - window])
+            if np.isnan(old):
+                nans -= 1
+            else:
+                s -= old
+                s2 -= old * old
+        if i >= window - 1 and nans == 0:
+            mean[i] = s / window
+            if window > 1:
+                var = (s2 - s * s / window) / (window - 1)
+                std[i] = np.sqrt(var) if var > 0.0 else 0.0
+    return mean, std
+
+@numba.njit(parallel=True)
+def _minmax_inplace(a):
+    """
+    Min-max scale each column of a 2-D array to [0, 1], in place.
+
+    NaNs are ignored when finding the range and stay NaN; constant columns
+    scale to 0, as sklearn's MinMaxScaler does.
+    """
+    for j in numba.prange(a.shape[1]):
+        mn = np.inf
+        mx = -np.inf
+        for i in range(a.shape[0]):
+            v = a[i, j]
+            if v < mn:
+                mn = v
+            if v > mx:
+                mx = v
+        rng = mx - mn
+        if not rng > 0.0:
+            rng = 1.0
+        for i in range(a.shape[0]):
+            a[i, j] = (a[i, j] - mn) / rng
+
+def _as_float_array(series):
+    """
+    Return a Series as a contiguous float array, keeping float32 data as float32.
+    """
+    return np.ascontiguousarray(series.to_numpy(dtype=np.result_type(series.dtype, np.float32)))
+
+def _pct_change_fast(arr):
+    """
+    Percentage change between consecutive values along the last axis, in percent.
+
+    The first value is NaN. Unlike pandas' pct_change, NaNs are not forward
+    filled first.
+    """
+    returns = np.empty(arr.shape, dtype=np.result_type(arr.dtype, np.float32))
+    if arr.shape[-1] == 0:
+        return returns
+    returns[..., 0] = np.nan
+    # A zero price gives inf/NaN returns, as in pandas, without the warnings
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.subtract(arr[..., 1:], arr[..., :-1], out=returns[..., 1:])
+        np.divide(returns[..., 1:], arr[..., :-1], out=returns[..., 1:])
+        returns[..., 1:] *= 100
+    return returns
+
+def _add_rolling_features(data, window):
+    """
+    Set the 'Rolling Mean' and 'Rolling Std' columns of a ticker's data from its current Close.
+    """
+    data['Rolling Mean'], data['Rolling Std'] = _rolling_mean_std(
+        _as_float_array(data['Close']), window
+    )
+
+def _map_tickers(compute, data_frames):
+    """
+    Run compute(ticker, data) for every ticker in a thread pool.
+
+    Only for work that stays in NumPy/pandas/Numba code releasing the GIL;
+    plotting must stay on the calling thread.
+
+    Returns:
+    - Dictionary of results, in the order of data_frames
+    """
+    tickers = list(data_frames)
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(tickers)))) as executor:
+        return dict(zip(tickers, executor.map(compute, tickers, data_frames.values())))
+
+def _compute_daily_returns(ticker, data):
+    data['Daily Return'] = _pct_change_fast(data['Close'].to_numpy())
+    return data['Daily Return']
+
+def _compute_volatility(ticker, data, window):
+    _add_rolling_features(data, window)
+    return data['Rolling Mean'], data['Rolling Std']
+
+def _compute_outliers(ticker, data, threshold):
+    c = _as_float_array(data['Close'])
+    z = c - c.mean()
+    np.divide(z, c.std(), out=z)
+    data['Z-Score'] = z
+    return data.iloc[np.flatnonzero(np.abs(z) > threshold)]
+
+def _compute_unusual_returns(ticker, data, threshold):
+    daily_return = _compute_daily_returns(ticker, data)
+    return data[(daily_return > threshold) | (daily_return < -threshold)]
+
+def _seasonal_decompose_additive(x, period):
+    """
+    Additive seasonal decomposition of the columns of a 2-D array.
+
+    Gives the same components as statsmodels' seasonal_decompose(x, model='additive',
+    period=period), but computes the centered moving-average trend with an FFT
+    convolution, O(n log n) instead of O(n * period).
+
+    Returns:
+    - trend, seasonal, resid arrays shaped like x; the trend and residual are
+      NaN for the first and last period // 2 rows
+    """
+    from scipy.signal import fftconvolve
+
+    nobs, ncols = x.shape
+    if np.isnan(x).any():
+        raise ValueError("This function does not handle missing values")
+    if nobs < 2 * period:
+        raise ValueError(
+            f"x must have 2 complete cycles requires {2 * period} observations. "
+            f"x only has {nobs} observation(s)"
+        )
+
+    # Centered moving average; an even period uses half weights at both ends
+    if period % 2 == 0:
+        kernel = np.r_[0.5, np.ones(period - 1), 0.5] / period
+    else:
+        kernel = np.full(period, 1.0 / period)
+    half = len(kernel) // 2
+    trend = np.full(x.shape, np.nan)
+    trend[half:nobs - half] = fftconvolve(x, kernel[:, None], mode='valid', axes=0)
+
+    # Average the detrended values at each position of the cycle
+    detrended = x - trend
+    padded = np.vstack([detrended, np.full(((-nobs) % period, ncols), np.nan)])
+    period_averages = np.nanmean(padded.reshape(-1, period, ncols), axis=0)
+    period_averages -= period_averages.mean(axis=0)
+    seasonal = np.tile(period_averages, (nobs // period + 1, 1))[:nobs]
+
+    return trend, seasonal, detrended - seasonal
+
+_NON_INTERACTIVE_BACKENDS = {'agg', 'cairo', 'pdf', 'pgf', 'ps', 'svg', 'template'}
+
+def _ticker_axes(items, figsize=(10, 5)):
+    """
+    Yield (item, ax) for each per-ticker plot, showing the plot once the caller has drawn it.
+
+    Notebooks and non-interactive backends reuse one figure, clearing its Axes
+    for every ticker; notebooks get a snapshot of each plot. GUI backends show
+    every plot with a blocking plt.show(), so a fresh figure is made after the
+    user closes each window.
+    """
+    backend = matplotlib.get_backend().lower()
+    inline = 'inline' in backend
+    interactive = not inline and backend not in _NON_INTERACTIVE_BACKENDS
+
+    fig = ax = None
+    for item in items:
+        if fig is None:
+            fig, ax = plt.subplots(figsize=figsize)
+        else:
+            ax.clear()
+        yield item, ax
+
+        if inline:
+            from IPython.display import display
+            display(fig)
+        elif interactive:
+            plt.show()
+            fig = None
+        else:
+            fig.canvas.draw()
+
+    # Also keeps notebooks from displaying the figure again at the end of the cell
+    if fig is not None:
+        plt.close(fig)
+
 def download_historical_data(tickers, start_date, end_date):
     """
     Download historical financial data for the given tickers and date range.
@@ -19,40 +224,94 @@ def download_historical_data(tickers, start_date, end_date):
     Returns:
     - Pandas DataFrame containing the historical data
     """
-    return yf.download(tickers, start=start_date, end=end_date)
+    return yf.download(tickers, start=start_date, end=end_date,
+                       group_by='ticker', threads=True, progress=False)
 
 def separate_data(historical_data, tickers):
     """
     Separate the historical data into individual DataFrames for each ticker.
 
     Parameters:
-    - historical_data: DataFrame containing the historical data
+    - historical_data: DataFrame containing the historical data, with either the
+      ticker or the price field on the outer column level
     - tickers: List of ticker symbols
 
     Returns:
     - Dictionary of DataFrames, one for each ticker
     """
-    data_frames = {}
-    for ticker in tickers:
-        data = historical_data['Close'][ticker].reset_index()
-        data.columns = ['Date', 'Close']
-        data['Open'] = historical_data['Open'][ticker].values
-        data['High'] = historical_data['High'][ticker].values
-        data['Low'] = historical_data['Low'][ticker].values
-        data['Volume'] = historical_data['Volume'][ticker].values
-        data_frames[ticker] = data
-    return data_frames
+    # Put the ticker on the outer column level so each ticker is a single block
+    if not set(tickers).issubset(historical_data.columns.get_level_values(0)):
+        historical_data = historical_data.swaplevel(0, 1, axis=1).sort_index(axis=1)
+
+    return {
+        ticker: historical_data[ticker]
+        .reset_index()
+        .rename(columns={'index': 'Date'})[['Date', 'Close', 'Open', 'High', 'Low', 'Volume']]
+        for ticker in tickers
+    }
+
+@dataclass
+class PanelData:
+    """
+    OHLCV data of all tickers in one (n_tickers, n_days, n_cols) array on a shared Date axis.
+
+    Attributes:
+    - values: Array of shape (n_tickers, n_days, n_cols); days missing for a ticker are NaN
+    - tickers: List of ticker symbols, in the order of the first axis
+    - dates: DatetimeIndex of the second axis
+    - cols: Column names, in the order of the last axis
+    """
+    values: np.ndarray
+    tickers: list
+    dates: pd.DatetimeIndex
+    cols: tuple = ('Open', 'High', 'Low', 'Close', 'Volume')
+
+    @classmethod
+    def from_data_frames(cls, data_frames, dtype='float32'):
+        """
+        Build a panel from a dictionary of per-ticker DataFrames with a 'Date' column.
+
+        All columns share one dtype; float32 rounds volumes above 2**24, so pass
+        dtype='float64' when exact volumes matter.
+        """
+        tickers = list(data_frames)
+        cols = cls.cols
+        dates = pd.DatetimeIndex(
+            pd.concat([data['Date'] for data in data_frames.values()]).unique()
+        ).sort_values()
+        values = np.stack([
+            data.set_index('Date').reindex(dates)[list(cols)].to_numpy(dtype=dtype)
+            for data in data_frames.values()
+        ])
+        return cls(values, tickers, dates, cols)
+
+    def column(self, name):
+        """
+        Return one column for all tickers as a (n_tickers, n_days) view.
+        """
+        return self.values[:, :, self.cols.index(name)]
+
+    def to_data_frames(self):
+        """
+        Convert the panel back to a dictionary of per-ticker DataFrames.
+        """
+        return {
+            ticker: pd.DataFrame(self.values[i], index=self.dates, columns=list(self.cols))
+            .rename_axis('Date')
+            .reset_index()
+            for i, ticker in enumerate(self.tickers)
+        }
 
 def check_basic_statistics(data_frames):
     """
-    Print basic statistics for each ticker's data.
+    Print basic statistics for each ticker's data, one column per ticker.
 
     Parameters:
     - data_frames: Dictionary of DataFrames, one for each ticker
     """
-    for ticker, data in data_frames.items():
-        print(f"Basic Statistics for {ticker}:")
-        print(data.describe(), "\n")
+    combined = pd.concat(data_frames, names=['ticker'])
+    print("Basic Statistics:")
+    print(combined.groupby(level='ticker', sort=False).describe().T, "\n")
 
 def ensure_data_types(data_frames):
     """
@@ -61,27 +320,29 @@ def ensure_data_types(data_frames):
     Parameters:
     - data_frames: Dictionary of DataFrames, one for each ticker
     """
-    for ticker, data in data_frames.items():
-        print(f"Data Types for {ticker}:")
-        print(data.dtypes, "\n")
+    # Read from each frame's metadata: concatenating would upcast mismatched dtypes
+    print("Data Types:")
+    print(pd.DataFrame({ticker: data.dtypes for ticker, data in data_frames.items()}), "\n")
 
-def standardize_data_types(data_frames):
+def standardize_data_types(data_frames, dtype='float32'):
     """
-    Standardize the data types of numerical columns to float64.
+    Standardize the data types of numerical columns: prices to float32 by
+    default, Volume always to float64 so large volumes stay exact.
 
     Parameters:
     - data_frames: Dictionary of DataFrames, one for each ticker
+    - dtype: Floating point type for the price columns (default: 'float32')
 
     Returns:
     - Dictionary of DataFrames with standardized data types
     """
     for ticker, data in data_frames.items():
-        # Convert numerical columns to float64
+        # Convert numerical columns to float; float32 can't hold volumes above 2**24 exactly
         data_frames[ticker] = data.astype({
-            'Close': 'float64',
-            'Open': 'float64',
-            'High': 'float64',
-            'Low': 'float64',
+            'Close': dtype,
+            'Open': dtype,
+            'High': dtype,
+            'Low': dtype,
             'Volume': 'float64'
         })
     return data_frames
@@ -92,9 +353,9 @@ def check_missing_values(data_frames):
     Parameters:
     - data_frames: Dictionary of DataFrames, one for each ticker
     """
-    for ticker, data in data_frames.items():
-        print(f"Missing Values for {ticker}:")
-        print(data.isnull().sum(), "\n")
+    combined = pd.concat(data_frames, names=['ticker'])
+    print("Missing Values:")
+    print(combined.isna().groupby(level='ticker', sort=False).sum().T, "\n")
 
 def handle_missing_values(data_frames, method='ffill'):
     """
@@ -104,25 +365,47 @@ def handle_missing_values(data_frames, method='ffill'):
     - data_frames: Dictionary of DataFrames, one for each ticker
     - method: Method to handle missing values ('ffill', 'bfill', 'interpolate', 'drop')
     """
+    if method not in ('ffill', 'bfill', 'interpolate', 'drop'):
+        raise ValueError(f"Unknown method for handling missing values: {method!r}")
+
     for ticker, data in data_frames.items():
+        # Nothing to fill, so skip the copy
+        if not data.isna().to_numpy().any():
+            continue
+
         if method == 'drop':
             data_frames[ticker] = data.dropna()
+        elif method == 'ffill':
+            data_frames[ticker] = data.ffill()
+        elif method == 'bfill':
+            data_frames[ticker] = data.bfill()
         else:
-            data_frames[ticker] = data.fillna(method=method)
+            numeric = data.select_dtypes('number').columns
+            data = data.copy()
+            data[numeric] = data[numeric].interpolate(method='linear')
+            data_frames[ticker] = data
     return data_frames
 
 def normalize_data(data_frames):
     """
-    Normalize or scale the data using MinMaxScaler.
+    Normalize or scale the data to the [0, 1] range (min-max scaling).
 
     Parameters:
-    - data_frames: Dictionary of DataFrames, one for each ticker
+    - data_frames: Dictionary of DataFrames, one for each ticker, or a PanelData
     """
-    scaler = MinMaxScaler()
+    if isinstance(data_frames, PanelData):
+        # Each ticker is a contiguous (n_days, n_cols) view, scaled in place
+        for values in data_frames.values:
+            _minmax_inplace(values)
+        return data_frames
+
+    # Prices and Volume are scaled separately so each keeps its own dtype
+    column_groups = (['Close', 'Open', 'High', 'Low'], ['Volume'])
     for ticker, data in data_frames.items():
-        data_frames[ticker][['Close', 'Open', 'High', 'Low', 'Volume']] = scaler.fit_transform(
-            data[['Close', 'Open', 'High', 'Low', 'Volume']]
-        )
+        for cols in column_groups:
+            arr = np.array(data[cols], dtype=np.result_type(*data[cols].dtypes, np.float32))
+            _minmax_inplace(arr)
+            data_frames[ticker][cols] = arr
     return data_frames
 
 def display_cleaned_data(data_frames):
@@ -143,56 +426,82 @@ def plot_closing_prices(data_frames):
     Parameters:
     - data_frames: Dictionary of DataFrames, one for each ticker
     """
-    for ticker, data in data_frames.items():
-        plt.figure(figsize=(10, 5))
-        plt.plot(data['Date'], data['Close'], label='Close Price')
-        plt.title(f'{ticker} Closing Price Over Time')
-        plt.xlabel('Date')
-        plt.ylabel('Close Price')
-        plt.legend()
-        plt.grid()
-        plt.show()
+    for (ticker, data), ax in _ticker_axes(data_frames.items()):
+        ax.plot(data['Date'], data['Close'], label='Close Price')
+        ax.set_title(f'{ticker} Closing Price Over Time')
+        ax.set_xlabel('Date')
+        ax.set_ylabel('Close Price')
+        ax.legend()
+        ax.grid()
 
 def calculate_daily_returns(data_frames):
     """
     Calculate and plot the daily percentage change (returns) for each ticker.
 
     Parameters:
-    - data_frames: Dictionary of DataFrames, one for each ticker
+    - data_frames: Dictionary of DataFrames, one for each ticker, or a PanelData
+
+    Returns:
+    - For a PanelData, the (n_tickers, n_days) array of daily returns (%)
     """
-    for ticker, data in data_frames.items():
-        data['Daily Return'] = data['Close'].pct_change() * 100
-        plt.figure(figsize=(10, 5))
-        plt.plot(data['Date'], data['Daily Return'], label='Daily Return', color='orange')
-        plt.title(f'{ticker} Daily Percentage Change (Returns)')
-        plt.xlabel('Date')
-        plt.ylabel('Daily Return (%)')
-        plt.legend()
-        plt.grid()
-        plt.show()
+    if isinstance(data_frames, PanelData):
+        close = data_frames.column('Close')
+        returns = _pct_change_fast(close)
+        series = [(ticker, data_frames.dates, returns[i]) for i, ticker in enumerate(data_frames.tickers)]
+    else:
+        returns = None
+        daily_returns = _map_tickers(_compute_daily_returns, data_frames)
+        series = [(ticker, data_frames[ticker]['Date'], daily_returns[ticker]) for ticker in daily_returns]
+
+    for (ticker, dates, daily_return), ax in _ticker_axes(series):
+        ax.plot(dates, daily_return, label='Daily Return', color='orange')
+        ax.set_title(f'{ticker} Daily Percentage Change (Returns)')
+        ax.set_xlabel('Date')
+        ax.set_ylabel('Daily Return (%)')
+        ax.legend()
+        ax.grid()
+    return returns
 
 def analyze_volatility(data_frames, window=30):
     """
     Analyze volatility by calculating rolling means and standard deviations.
 
     Parameters:
-    - data_frames: Dictionary of DataFrames, one for each ticker
+    - data_frames: Dictionary of DataFrames, one for each ticker, or a PanelData
     - window: Rolling window size (default: 30 days)
-    """
-    for ticker, data in data_frames.items():
-        data['Rolling Mean'] = data['Close'].rolling(window=window).mean()
-        data['Rolling Std'] = data['Close'].rolling(window=window).std()
 
-        plt.figure(figsize=(10, 5))
-        plt.plot(data['Date'], data['Close'], label='Close Price', color='blue')
-        plt.plot(data['Date'], data['Rolling Mean'], label=f'{window}-Day Rolling Mean', color='green')
-        plt.plot(data['Date'], data['Rolling Std'], label=f'{window}-Day Rolling Std', color='red')
-        plt.title(f'{ticker} Volatility Analysis (Rolling Mean & Std)')
-        plt.xlabel('Date')
-        plt.ylabel('Price')
-        plt.legend()
-        plt.grid()
-        plt.show()
+    Returns:
+    - For a PanelData, the (n_tickers, n_days) arrays of rolling means and rolling stds
+    """
+    if isinstance(data_frames, PanelData):
+        close = data_frames.column('Close')
+        rolling_mean = np.empty(close.shape, dtype=close.dtype)
+        rolling_std = np.empty(close.shape, dtype=close.dtype)
+        for i in range(close.shape[0]):
+            rolling_mean[i], rolling_std[i] = _rolling_mean_std(np.ascontiguousarray(close[i]), window)
+        series = [
+            (ticker, data_frames.dates, close[i], rolling_mean[i], rolling_std[i])
+            for i, ticker in enumerate(data_frames.tickers)
+        ]
+        result = rolling_mean, rolling_std
+    else:
+        stats = _map_tickers(partial(_compute_volatility, window=window), data_frames)
+        series = [
+            (ticker, data_frames[ticker]['Date'], data_frames[ticker]['Close'], *stats[ticker])
+            for ticker in stats
+        ]
+        result = None
+
+    for (ticker, dates, close, rolling_mean, rolling_std), ax in _ticker_axes(series):
+        ax.plot(dates, close, label='Close Price', color='blue')
+        ax.plot(dates, rolling_mean, label=f'{window}-Day Rolling Mean', color='green')
+        ax.plot(dates, rolling_std, label=f'{window}-Day Rolling Std', color='red')
+        ax.set_title(f'{ticker} Volatility Analysis (Rolling Mean & Std)')
+        ax.set_xlabel('Date')
+        ax.set_ylabel('Price')
+        ax.legend()
+        ax.grid()
+    return result
 
 
 
@@ -208,26 +517,23 @@ def decompose_time_series_all_in_one(data_frames, period=252):
         data_frames (dict): A dictionary where keys are ticker symbols (e.g., 'TSLA') and values are DataFrames.
         period (int): The period for seasonal decomposition (default is 252 for annual seasonality in trading days).
     """
-    # Initialize dictionaries to store decomposed components
+    # Align the closing prices of all assets on Date, one column per ticker
+    tickers = list(data_frames)
+    closes = pd.concat(
+        [data['Close'].set_axis(data['Date']) for data in data_frames.values()], axis=1, keys=tickers
+    ).sort_index()
+
+    # Decompose all assets at once; each column is treated as its own series
+    trend, seasonal, resid = _seasonal_decompose_additive(closes.to_numpy(dtype='float64'), period)
+
+    # Store the components
     trends = {}
     seasonals = {}
     residuals = {}
-
-    # Perform decomposition for each asset
-    for ticker, data in data_frames.items():
-        # Ensure the data is sorted by date
-        data = data.sort_values('Date')
-        
-        # Set the date column as the index
-        data.set_index('Date', inplace=True)
-        
-        # Perform seasonal decomposition
-        decomposition = seasonal_decompose(data['Close'], model='additive', period=period)
-        
-        # Store the components
-        trends[ticker] = decomposition.trend
-        seasonals[ticker] = decomposition.seasonal
-        residuals[ticker] = decomposition.resid
+    for i, ticker in enumerate(tickers):
+        trends[ticker] = pd.Series(trend[:, i], index=closes.index)
+        seasonals[ticker] = pd.Series(seasonal[:, i], index=closes.index)
+        residuals[ticker] = pd.Series(resid[:, i], index=closes.index)
 
     # Plot Trend Components
     plt.figure(figsize=(14, 7))
@@ -259,48 +565,48 @@ def decompose_time_series_all_in_one(data_frames, period=252):
     plt.legend()
     plt.show()
 
-def visualize_All_in_one(data_frames):
+def visualize_All_in_one(data_frames, window=20):
+    """
+    Plot closing prices, daily returns and rolling statistics of all tickers together.
+
+    Parameters:
+    - data_frames: Dictionary of DataFrames, one for each ticker
+    - window: Rolling window size (default: 20 days)
+    """
+    # One column per ticker, aligned on Date
+    closes = pd.concat(
+        {ticker: data['Close'].set_axis(data['Date']) for ticker, data in data_frames.items()}, axis=1
+    ).sort_index()
+    returns = pd.DataFrame(_pct_change_fast(closes.to_numpy().T).T, index=closes.index, columns=closes.columns)
+    stats = {
+        ticker: _rolling_mean_std(_as_float_array(closes[ticker]), window)
+        for ticker in closes.columns
+    }
+    rolling_mean = pd.DataFrame({ticker: stats[ticker][0] for ticker in stats}, index=closes.index)
+    rolling_std = pd.DataFrame({ticker: stats[ticker][1] for ticker in stats}, index=closes.index)
+
     # Plot Closing Price Over Time
-    plt.figure(figsize=(14, 7))
-    for ticker, data in data_frames.items():
-        plt.plot(data['Date'], data['Close'], label=ticker)
-    plt.title('Closing Price Over Time')
-    plt.xlabel('Date')
-    plt.ylabel('Closing Price')
-    plt.legend()
+    _, ax = plt.subplots(figsize=(14, 7))
+    closes.plot(ax=ax, title='Closing Price Over Time', xlabel='Date', ylabel='Closing Price')
     plt.show()
 
     # Plot Daily Percentage Change
-    plt.figure(figsize=(14, 7))
-    for ticker, data in data_frames.items():
-        data['Daily Return'] = data['Close'].pct_change()
-        plt.plot(data['Date'], data['Daily Return'], label=ticker)
-    plt.title('Daily Percentage Change')
-    plt.xlabel('Date')
-    plt.ylabel('Daily Return')
-    plt.legend()
+    _, ax = plt.subplots(figsize=(14, 7))
+    returns.plot(ax=ax, title='Daily Percentage Change', xlabel='Date', ylabel='Daily Return (%)')
     plt.show()
 
     # Plot Rolling Mean (Volatility Analysis)
-    plt.figure(figsize=(14, 7))
-    for ticker, data in data_frames.items():
-        data['Rolling Mean'] = data['Close'].rolling(window=20).mean()
-        plt.plot(data['Date'], data['Rolling Mean'], label=f'{ticker} Rolling Mean')
-    plt.title('Volatility Analysis (Rolling Mean)')
-    plt.xlabel('Date')
-    plt.ylabel('Rolling Mean')
-    plt.legend()
+    _, ax = plt.subplots(figsize=(14, 7))
+    rolling_mean.add_suffix(' Rolling Mean').plot(
+        ax=ax, title='Volatility Analysis (Rolling Mean)', xlabel='Date', ylabel='Rolling Mean'
+    )
     plt.show()
 
     # Plot Rolling Standard Deviation (Volatility Analysis)
-    plt.figure(figsize=(14, 7))
-    for ticker, data in data_frames.items():
-        data['Rolling Std'] = data['Close'].rolling(window=20).std()
-        plt.plot(data['Date'], data['Rolling Std'], label=f'{ticker} Rolling Std')
-    plt.title('Volatility Analysis (Rolling Standard Deviation)')
-    plt.xlabel('Date')
-    plt.ylabel('Rolling Std')
-    plt.legend()
+    _, ax = plt.subplots(figsize=(14, 7))
+    rolling_std.add_suffix(' Rolling Std').plot(
+        ax=ax, title='Volatility Analysis (Rolling Standard Deviation)', xlabel='Date', ylabel='Rolling Std'
+    )
     plt.show()
 
 
@@ -309,15 +615,26 @@ def detect_outliers(data_frames, threshold=3):
     Detect outliers using the Z-score method.
 
     Parameters:
-    - data_frames: Dictionary of DataFrames, one for each ticker
+    - data_frames: Dictionary of DataFrames, one for each ticker, or a PanelData
     - threshold: Z-score threshold for outlier detection (default: 3)
-    """
-    from scipy.stats import zscore
-
-    for ticker, data in data_frames.items():
-        data['Z-Score'] = zscore(data['Close'])
-        outliers = data[abs(data['Z-Score']) > threshold]
 
+    Returns:
+    - For a PanelData, the (n_tickers, n_days) array of Z-scores
+    """
+    if isinstance(data_frames, PanelData):
+        close = data_frames.column('Close')
+        z = close - np.nanmean(close, axis=1, keepdims=True)
+        np.divide(z, np.nanstd(close, axis=1, keepdims=True), out=z)
+        for i, ticker in enumerate(data_frames.tickers):
+            idx = np.flatnonzero(np.abs(z[i]) > threshold)
+            outliers = pd.DataFrame({'Date': data_frames.dates[idx], 'Close': close[i, idx], 'Z-Score': z[i, idx]})
+
+            print(f"Outliers for {ticker}:")
+            print(outliers, "\n")
+        return z
+
+    results = _map_tickers(partial(_compute_outliers, threshold=threshold), data_frames)
+    for ticker, outliers in results.items():
         print(f"Outliers for {ticker}:")
         print(outliers[['Date', 'Close', 'Z-Score']], "\n")
 
@@ -329,20 +646,31 @@ def analyze_unusual_returns(data_frames, threshold=2):
     - data_frames: Dictionary of DataFrames, one for each ticker
     - threshold: Threshold for unusual returns (default: 2%)
     """
-    for ticker, data in data_frames.items():
-        if 'Daily Return' not in data.columns:
-            data['Daily Return'] = data['Close'].pct_change() * 100
-
-        unusual_returns = data[(data['Daily Return'] > threshold) | (data['Daily Return'] < -threshold)]
-
+    results = _map_tickers(partial(_compute_unusual_returns, threshold=threshold), data_frames)
+    for ticker, unusual_returns in results.items():
         print(f"Unusual Returns for {ticker}:")
         print(unusual_returns[['Date', 'Close', 'Daily Return']], "\n")
 
-def save_ticker_data(data_frames, output_directory):
-    for ticker, data in data_frames.items():
+def save_ticker_data(data_frames, output_directory, csv=False):
+    """
+    Save each ticker's data to its own file, writing the tickers concurrently.
+
+    Parameters:
+    - data_frames: Dictionary of DataFrames, one for each ticker
+    - output_directory: Directory the files are written to
+    - csv: Write CSV files instead of Parquet (default: False)
+    """
+    extension = 'csv' if csv else 'parquet'
+
+    def save(ticker, data):
         # Define the file path
-        file_path = f"{output_directory}/{ticker}_data.csv"
+        file_path = f"{output_directory}/{ticker}_data.{extension}"
+
+        if csv:
+            data.to_csv(file_path, index=False)
+        else:
+            data.to_parquet(file_path, index=False, compression='snappy')
+        return file_path
 
-        # Save the DataFrame to a CSV file
-        data.to_csv(file_path, index=False)
-        print(f"Data for {ticker} saved to {file_path}")
\ No newline at end of file
+    for ticker, file_path in _map_tickers(save, data_frames).items():
+        print(f"Data for {ticker} saved to {file_path}")
@@ -11,7 +11,10 @@ def load_trained_model(model_path):
 
 # Load historical data
 def load_data(file_path):
-    data = pd.read_csv(file_path)
+    if file_path.endswith('.parquet'):
+        data = pd.read_parquet(file_path)
+    else:
+        data = pd.read_csv(file_path)
     return data
 def preprocess_data(data, target_column, sequence_length):
     # Extract the target column (e.g., 'Close' prices)
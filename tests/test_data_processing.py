@@ -0,0 +1,112 @@
+import os
+import sys
+import unittest
+import warnings
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+from data_processing import (
+    _pct_change_fast,
+    _rolling_mean_std,
+    _seasonal_decompose_additive,
+    normalize_data,
+    standardize_data_types,
+)
+
+
+class TestRollingMeanStd(unittest.TestCase):
+    def test_float32_matches_pandas(self):
+        # BND-like series: price around 72 with small daily moves
+        rng = np.random.default_rng(0)
+        close = (72 + np.cumsum(rng.normal(0, 0.05, 500))).astype('float32')
+
+        for window in (7, 20, 30):
+            mean, std = _rolling_mean_std(close, window)
+            rolling = pd.Series(close).rolling(window)
+
+            self.assertEqual(mean.dtype, np.float32)
+            np.testing.assert_allclose(mean, rolling.mean().to_numpy(), rtol=1e-5, equal_nan=True)
+            np.testing.assert_allclose(std, rolling.std().to_numpy(), rtol=1e-5, equal_nan=True)
+
+
+def make_ticker_data():
+    return pd.DataFrame({
+        'Date': pd.date_range('2024-01-01', periods=3),
+        'Close': [72.1, 72.3, 71.8],
+        'Open': [72.0, 72.2, 72.4],
+        'High': [72.4, 72.5, 72.6],
+        'Low': [71.9, 72.0, 71.7],
+        'Volume': [172791247, 176281586, 150000000],
+    })
+
+
+class TestStandardizeDataTypes(unittest.TestCase):
+    def test_volume_stays_exact(self):
+        result = standardize_data_types({'BND': make_ticker_data()})['BND']
+
+        self.assertEqual(result['Close'].dtype, np.float32)
+        self.assertEqual(result['Volume'].tolist(), [172791247, 176281586, 150000000])
+
+
+class TestNormalizeData(unittest.TestCase):
+    def test_dtypes_survive(self):
+        data_frames = standardize_data_types({'BND': make_ticker_data()})
+
+        result = normalize_data(data_frames)['BND']
+
+        for col in ['Close', 'Open', 'High', 'Low']:
+            self.assertEqual(result[col].dtype, np.float32)
+        self.assertEqual(result['Volume'].dtype, np.float64)
+        np.testing.assert_allclose(result['Close'], [0.6, 1.0, 0.0], rtol=1e-4)
+        np.testing.assert_allclose(result['Volume'], [22791247 / 26281586, 1.0, 0.0])
+
+
+class TestPctChangeFast(unittest.TestCase):
+    def test_matches_pandas(self):
+        # pct_change(fill_method=None): neither side forward fills the NaN
+        close = pd.Series([72.0, 72.5, np.nan, 73.0, 0.0, 0.0, 71.5])
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            returns = _pct_change_fast(close.to_numpy())
+
+        np.testing.assert_allclose(returns, close.pct_change(fill_method=None).to_numpy() * 100, equal_nan=True)
+
+    def test_empty(self):
+        self.assertEqual(_pct_change_fast(np.array([], dtype='float32')).shape, (0,))
+
+
+class TestSeasonalDecomposeAdditive(unittest.TestCase):
+    def test_linear_trend_plus_cycle(self):
+        for period in (7, 12):
+            t = np.arange(10 * period)
+            cycle = np.sin(2 * np.pi * np.arange(period) / period)
+            cycle -= cycle.mean()
+            x = np.column_stack([2.0 * t + cycle[t % period], 100.0 - 0.5 * t + 3 * cycle[t % period]])
+
+            trend, seasonal, resid = _seasonal_decompose_additive(x, period)
+
+            half = period // 2
+            np.testing.assert_allclose(trend[half:-half, 0], 2.0 * t[half:-half], atol=1e-9)
+            np.testing.assert_allclose(trend[half:-half, 1], 100.0 - 0.5 * t[half:-half], atol=1e-9)
+            self.assertTrue(np.isnan(trend[:half]).all() and np.isnan(trend[-half:]).all())
+            np.testing.assert_allclose(seasonal[:, 0], cycle[t % period], atol=1e-9)
+            np.testing.assert_allclose(seasonal[:, 1], 3 * cycle[t % period], atol=1e-9)
+            np.testing.assert_allclose(resid[half:-half], 0.0, atol=1e-9)
+
+    def test_rejects_missing_values(self):
+        x = np.ones((30, 1))
+        x[5] = np.nan
+        with self.assertRaises(ValueError):
+            _seasonal_decompose_additive(x, 7)
+
+    def test_requires_two_cycles(self):
+        with self.assertRaises(ValueError):
+            _seasonal_decompose_additive(np.ones((13, 1)), 7)
+
+
+if __name__ == '__main__':
+    unittest.main()